@@ -1,21 +1,145 @@
 import weakref
 import inspect
-from typing import Callable, List, NamedTuple
+from types import MethodType
+from typing import Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+def _receiver_key(callback: Callable) -> Hashable:
+    """
+    Returns the key a callback is stored under in `Event.receivers`.
+    Bound methods are keyed by their instance and function, since a new method object is created on every attribute access.
+    """
+    if type(callback) is MethodType:
+        return (id(callback.__self__), id(callback.__func__))
+    return id(callback)
+
+def _make_reaper(event: "Event", key: Hashable) -> Callable:
+    """
+    Returns a weakref callback that removes the connection stored under `key` once its callback dies.
+    Only a weak reference to `event` is held, so receivers do not keep the event alive.
+    """
+    event_ref = weakref.ref(event)
+
+    def reap(ref: weakref.ref) -> None:
+        event = event_ref()
+        if event is None:
+            return
+        connection = event.receivers.get(key)
+        # The key may have been reused by a newer connection since this one was made
+        if connection is not None and connection.callback is ref:
+            del event.receivers[key]
+            event._dispatch = None
+
+    return reap
+
+def _function_of(callback: Callable) -> Tuple[Optional[Callable], int]:
+    """
+    Returns the plain Python function behind `callback` and how many of its leading arguments are already bound,
+    or `(None, 0)` if its code object does not describe its signature.
+    """
+    bound = 0
+    if type(callback) is MethodType:
+        callback = callback.__func__
+        bound = 1
+    # Decorated functions report the signature of what they wrap, only `inspect.signature` follows that
+    if hasattr(callback, "__code__") and not hasattr(callback, "__wrapped__") and not hasattr(callback, "__signature__"):
+        return callback, bound
+    return None, 0
+
+def _make_dispatch(receivers: Dict[Hashable, "Event.ConnectionType"]) -> Tuple[tuple, ...]:
+    """
+    Returns the snapshot of `receivers` iterated by the emit loops.
+    It is stored column-wise, one tuple of keys, one of connections and one per `ConnectionType` field,
+    so the loops zip flat tuples instead of unpacking a nested tuple per receiver.
+    """
+    connections = tuple(receivers.values())
+    if not connections:
+        return ()
+    return (tuple(receivers), connections, *zip(*connections))
+
+def _emit_catching(event: "Event", dispatch: tuple, args: tuple) -> None:
+    """
+    Dispatch loop used while `event.ignore_error` is set, `TypeError`s raised by receivers are swallowed.
+    """
+    # Bind loop invariants to locals once, instead of an attribute lookup per receiver
+    receivers = event.receivers
+    one_shot = Event.ConnectFlags.CONNECT_ONE_SHOT
+    for key, connection, ref, flags, owner_ref, function in zip(*dispatch):
+        # The snapshot may be stale, skip receivers erased or replaced earlier in this emit
+        if receivers.get(key) is not connection:
+            continue
+        # Methods are called through their function and owner, `WeakMethod.__call__` is pure Python
+        target = ref() if function is None else owner_ref()
+        # Can only happen if the callback died during this emit and its reaper has not run yet
+        if target is None:
+            continue
+
+        try:
+            if function is None:
+                target(*args)
+            else:
+                function(target, *args)
+        except TypeError:
+            pass
+
+        # The callback may have reconnected itself, only drop this connection
+        if flags & one_shot and receivers.get(key) is connection:
+            del receivers[key]
+            event._dispatch = None
+
+def _emit_raw(event: "Event", dispatch: tuple, args: tuple) -> None:
+    """
+    Dispatch loop used while `event.ignore_error` is not set, errors raised by receivers propagate.
+    """
+    receivers = event.receivers
+    one_shot = Event.ConnectFlags.CONNECT_ONE_SHOT
+    for key, connection, ref, flags, owner_ref, function in zip(*dispatch):
+        if receivers.get(key) is not connection:
+            continue
+        target = ref() if function is None else owner_ref()
+        if target is None:
+            continue
+
+        if function is None:
+            target(*args)
+        else:
+            function(target, *args)
+
+        if flags & one_shot and receivers.get(key) is connection:
+            del receivers[key]
+            event._dispatch = None
 
 class Event:
+    __slots__ = ("receivers", "_dispatch", "_ignore_error", "_emit_impl", "__weakref__")
+
     class ConnectFlags:
         CONNECT_ONE_SHOT: int = (1 >> 0)
 
     class ConnectionType(NamedTuple):
         callback: Callable
         flags: int
+        # For bound methods, a weak reference to the instance and the plain function, so emit can skip `WeakMethod`
+        owner: Optional[weakref.ref]
+        function: Optional[Callable]
 
     def __init__(self) -> None:
-        self.receivers: List[Event.ConnectionType] = []
+        self.receivers: Dict[Hashable, Event.ConnectionType] = {}
+        # Snapshot of `receivers` iterated by `emit`, rebuilt lazily after the receivers change
+        self._dispatch: Optional[Tuple[tuple, ...]] = None
         self.ignore_error = True
-        # Alias `disconnect` to `erase`
-        self.disconnect = self.erase
     
+    @property
+    def ignore_error(self) -> bool:
+        """
+        Whether `TypeError`s raised by receivers are ignored
+        """
+        return self._ignore_error
+
+    @ignore_error.setter
+    def ignore_error(self, value: bool) -> None:
+        self._ignore_error = value
+        # Pick the dispatch loop here so `emit` does not branch on it per receiver
+        self._emit_impl = _emit_catching if value else _emit_raw
+
     def connect(self, callback: Callable, flags: int = 0x0) -> None:
         """
         :param callback: A callable that will be called with parameters when event is emitted
@@ -25,78 +149,97 @@ class Event:
         if not callable(callback):
             raise TypeError("Tried to connect non-callable to event!")
 
-        if inspect.ismethod(callback):
-            self.receivers.append(Event.ConnectionType(weakref.WeakMethod(callback), flags))
+        key = _receiver_key(callback)
+        # Dead callbacks are removed by the reaper as soon as they are collected
+        if type(callback) is MethodType:
+            ref = weakref.WeakMethod(callback, _make_reaper(self, key))
+            owner, function = weakref.ref(callback.__self__), callback.__func__
         else:
-            self.receivers.append(Event.ConnectionType(weakref.ref(callback), flags))
+            ref = weakref.ref(callback, _make_reaper(self, key))
+            owner, function = None, None
+        self.receivers[key] = Event.ConnectionType(ref, flags, owner, function)
+        self._dispatch = None
     
     def erase(self, callback: Callable) -> None:
         """
         Removes the connection to `callback`
         :param callback: The callable that will be erased
         """
+        if self.receivers.pop(_receiver_key(callback), None) is not None:
+            self._dispatch = None
 
-        for i in range(len(self.receivers)):
-            if self.receivers[i].callback() == callback:
-                del self.receivers[i]
-                i -= 1
-                continue
+    # Alias `disconnect` to `erase`
+    disconnect = erase
     
     def clear(self) -> None:
         """
         Erase all callbacks
         """
         self.receivers.clear()
+        self._dispatch = None
     
     def emit(self, *args) -> None:
         """
+        Receivers erased during the emit are not called, receivers connected during the emit are first called on the next one.
         :param args: arguments to be emitted
         """
-        for i in range(len(self.receivers)):
-            callback = self.receivers[i].callback()
-            if callback is None:
-                del self.receivers[i]
-                i -= 1
-                continue
-
-            if self.ignore_error:
-                try:
-                    callback(*args)
-                except TypeError:
-                        pass
-            else:
-                callback(*args)
-                
-            if self.receivers[i].flags & Event.ConnectFlags.CONNECT_ONE_SHOT:
-                del self.receivers[i]
-                i -= 1
-                continue
+        # Iterate over a snapshot, callbacks may connect or erase while the event is emitting
+        dispatch = self._dispatch
+        if dispatch is None:
+            dispatch = self._dispatch = _make_dispatch(self.receivers)
+
+        self._emit_impl(self, dispatch, args)
 
 
 class TypedEvent(Event):
     """
     Subclass of `Event` with strong-typed parameters
     """
+    __slots__ = ("param_types", "_num_params")
+
     def __init__(self, *param_types) -> None:
         super().__init__()
         self.param_types = param_types
+        self._num_params = len(param_types)
 
     def emit(self, *args) -> None:
-        emit_types = tuple([type(param) for param in args])
-        if emit_types != self.param_types:
-            raise TypeError(f"TypedEvent emit expected argument types '{self.param_types}', but got `{emit_types} instead.`")
+        param_types = self.param_types
+        if len(args) != len(param_types):
+            raise self._emit_type_error(args)
+        # Types are singletons, stop at the first mismatch
+        for arg, param_type in zip(args, param_types):
+            if type(arg) is not param_type:
+                raise self._emit_type_error(args)
 
-        super().emit(*args)
+        # Inlined `Event.emit`, saves a call frame and re-packing `args`
+        dispatch = self._dispatch
+        if dispatch is None:
+            dispatch = self._dispatch = _make_dispatch(self.receivers)
+
+        self._emit_impl(self, dispatch, args)
+
+    def _emit_type_error(self, args: tuple) -> TypeError:
+        emit_types = tuple(type(param) for param in args)
+        return TypeError(f"TypedEvent emit expected argument types '{self.param_types}', but got `{emit_types} instead.`")
     
     def connect(self, callback: Callable, flags: int = 0x0) -> None:
-        callback_args = inspect.signature(callback).parameters
-        l = len(callback_args)
-        for p in callback_args:
-            if p == 'self':
-                l -= 1
-
-        if l != len(self.param_types):
-            raise TypeError(f"TypedEvent connect expected argument count of {len(self.param_types)}, but target has {l}. Target params: `{callback.__code__.co_varnames}`")
+        func, bound = _function_of(callback)
+        if func is not None:
+            # Count every parameter, including `*args`, keyword-only and `**kwargs`, reading the code object is much cheaper than building a `Signature`
+            code = func.__code__
+            l = (code.co_argcount + code.co_kwonlyargcount
+                 + bool(code.co_flags & inspect.CO_VARARGS) + bool(code.co_flags & inspect.CO_VARKEYWORDS)
+                 - bound)
+        else:
+            try:
+                l = len(inspect.signature(callback).parameters)
+            except TypeError:
+                # `inspect.signature` rejects anything that is not callable
+                raise TypeError("Tried to connect non-callable to event!") from None
+
+        if l != self._num_params:
+            target_params = func.__code__.co_varnames if func is not None else inspect.signature(callback)
+            raise TypeError(f"TypedEvent connect expected argument count of {self._num_params}, but target has {l}. Target params: `{target_params}`")
 
         super().connect(callback, flags)
 